@@ -30,7 +30,7 @@ def dfa_visualize():
     graph = visualizer.visualize_dfa(dfa)
     save_path_dfa = 'static/output/dfa/dfa_visualization'
     # Render and save the diagram
-    graph.render(save_path_dfa, cleanup=True)
+    visualizer.render_dot(graph, f"{save_path_dfa}.png")
     print(f"\n✅ DFA visualization saved to {save_path_dfa}.png")
 
     # 2) Visualize the DFA path for the input string
@@ -38,7 +38,7 @@ def dfa_visualize():
     graph, accepted, path = visualizer.visualize_dfa_path(dfa, s)
     print(f"String: {s}, Accepted: {accepted}, Path: {path}")
     save_path_trace = f'static/output/dfa/dfa_path_visualization_{s}'
-    graph.render(save_path_trace, cleanup=True)
+    visualizer.render_dot(graph, f"{save_path_trace}.png")
     print(f"\n✅ DFA path visualization saved to {save_path_trace}.png")
 
     return render_template("index.html",
@@ -62,7 +62,7 @@ def nfa_visualize():
     graph = visualizer.visualize_nfa(nfa)
     save_path_nfa = 'static/output/nfa/nfa_visualization'
     # Render and save the diagram
-    graph.render(save_path_nfa, cleanup=True)
+    visualizer.render_dot(graph, f"{save_path_nfa}.png")
     print(f"\n✅ NFA visualization saved to {save_path_nfa}.png")
 
     # 2) Convert NFA to DFA
@@ -70,7 +70,7 @@ def nfa_visualize():
     graph = visualizer.visualize_dfa(dfa)
     save_path_dfa = 'static/output/nfa/nfa_to_dfa_visualization'
     # Render and save the diagram
-    graph.render(save_path_dfa, cleanup=True)
+    visualizer.render_dot(graph, f"{save_path_dfa}.png")
     print(f"\n✅ NFA to DFA visualization saved to {save_path_dfa}.png")
 
     return render_template("index.html",
@@ -97,7 +97,7 @@ def enfa_visualize():
     graph = visualizer.visualize_e_nfa(e_nfa)
     save_path_enfa = 'static/output/enfa/enfa_visualization'
     # Render and save the diagram
-    graph.render(save_path_enfa, cleanup=True)
+    visualizer.render_dot(graph, f"{save_path_enfa}.png")
     print(f"\n✅ e-NFA visualization saved to {save_path_enfa}.png")
 
     return render_template("index.html",
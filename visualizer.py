@@ -1,50 +1,367 @@
-import graphviz as gv
+import functools
+import os
+import subprocess
+from collections import defaultdict
+from collections.abc import Hashable, Mapping
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import NamedTuple
 
+import numpy as np
 
-def visualize_dfa(dfa):
+try:
+    from numba import njit
+    _HAS_NUMBA = True
+except ImportError:  # Numba is optional, DFA paths then use dict lookups
+    _HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+
+def _quote(value):
+    """Quotes a state name, label or attribute value as a DOT string."""
+    return '"' + str(value).replace('"', '\\"') + '"'
+
+
+def _dot(lines):
+    """Joins DOT statements into the source of a directed graph."""
+    return 'digraph {\n' + '\n'.join(lines) + '\n}\n'
+
+
+def render_dot(dot_src, out_path, fmt='png'):
+    """Renders DOT source to a file with the Graphviz 'dot' command.
+
+    Args:
+        dot_src: The DOT source, as returned by the visualize_* functions.
+        out_path: The path of the output file, including its extension.
+        fmt: The output format passed to 'dot' (e.g. 'png', 'svg').
+    """
+
+    os.makedirs(os.path.dirname(out_path) or '.', exist_ok=True)
+    subprocess.run(['dot', f'-T{fmt}', '-o', out_path],
+                   input=dot_src.encode(), check=True)
+
+
+def _render_job(job):
+    """Renders a (dot_src, out_path) pair, for use with Executor.map."""
+    render_dot(*job)
+
+
+def _memoize_dfa(func):
+    """Caches the result of func(dfa, *args) for DFA instances.
+
+    A DFA is immutable, so results are cached by its identity. Other
+    automata (e.g. dictionaries) may change between calls and are passed to
+    func directly. The wrapped function must take only hashable extra
+    arguments and return a value that callers do not modify (e.g. a DOT
+    source string).
+    """
+
+    cached = functools.lru_cache(maxsize=64)(func)
+
+    @functools.wraps(func)
+    def wrapper(dfa, *args):
+        if isinstance(dfa, DFA):
+            return cached(dfa, *args)
+        return func(dfa, *args)
+
+    wrapper.cache_clear = cached.cache_clear
+    return wrapper
+
+
+def _group_edges(edges):
+    """Groups (state, symbol, next state) triples by (state, next state).
+
+    Returns:
+        A dictionary mapping (state, next state) pairs to the list of symbols
+        on the transitions between them, in first-seen order.
+    """
+    grouped = defaultdict(list)
+    for state, symbol, next_state in edges:
+        grouped[(state, next_state)].append(symbol)
+    return grouped
+
+
+def _edge_label(symbols):
+    """Formats the symbols of merged transitions as a single edge label."""
+    # Special handling for empty string
+    return ', '.join('ε' if symbol == 'λ' else str(symbol) for symbol in symbols)
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class DFA:
+    """A deterministic finite automaton.
+
+    A DFA is immutable: on construction its fields are copied into a tuple,
+    a read-only mapping and a frozenset, so later changes to the arguments
+    do not affect it and results computed from it can be cached. DFAs
+    compare and hash by identity.
+
+    Attributes:
+        states: A tuple of states.
+        alphabet: A tuple of input symbols.
+        transitions: A read-only mapping of transitions, where keys are tuples
+            of (state, input symbol), and values are the next states.
+        start_state: The start state.
+        accept_states: A frozenset of accepting states.
+    """
+
+    states: tuple
+    alphabet: tuple
+    transitions: Mapping
+    start_state: Hashable
+    accept_states: frozenset
+
+    def __post_init__(self):
+        object.__setattr__(self, 'states', tuple(self.states))
+        object.__setattr__(self, 'alphabet', tuple(self.alphabet))
+        object.__setattr__(self, 'transitions',
+                           MappingProxyType(dict(self.transitions)))
+        object.__setattr__(self, 'accept_states',
+                           frozenset(self.accept_states))
+
+
+class _DFAView(NamedTuple):
+    """A read-only view of a DFA dictionary with the attributes of a DFA.
+
+    Unlike a DFA, the view shares the dictionary's lists and transitions
+    instead of copying them, so it is cheap to build for a single call but
+    must not be cached.
+    """
+
+    states: list
+    alphabet: list
+    transitions: Mapping
+    start_state: Hashable
+    accept_states: frozenset
+
+
+def _as_dfa(dfa):
+    """Returns dfa as a DFA, or as a _DFAView of the dictionary form."""
+    if isinstance(dfa, (DFA, _DFAView)):
+        return dfa
+    return _DFAView(states=dfa['states'],
+                    alphabet=dfa['alphabet'],
+                    transitions=dfa['transitions'],
+                    start_state=dfa['start_state'],
+                    accept_states=frozenset(dfa['accept_states']))
+
+
+@_memoize_dfa
+def _compile_dfa_table(dfa):
+    """Compiles a DFA into a dense transition table.
+
+    States and symbols are numbered in order of first appearance, so the
+    transition function becomes a single indexed load instead of hashing a
+    (state, symbol) tuple.
+
+    Args:
+        dfa: A DFA, or a dictionary representing one (see visualize_dfa).
+
+    Returns:
+        A tuple containing:
+        - A dictionary mapping each state to its row in the table.
+        - A list mapping each row of the table back to its state.
+        - A dictionary mapping each input symbol to its column in the table.
+        - The transition table, an int32 array of shape (states, symbols)
+          holding the next state id, or -1 where there is no transition.
+        - A boolean array marking the accepting states.
+    """
+
+    dfa = _as_dfa(dfa)
+
+    state_ids = {}
+    symbol_ids = {}
+    for state in dfa.states:
+        state_ids.setdefault(state, len(state_ids))
+    state_ids.setdefault(dfa.start_state, len(state_ids))
+    for symbol in dfa.alphabet:
+        symbol_ids.setdefault(symbol, len(symbol_ids))
+    for (state, symbol), next_state in dfa.transitions.items():
+        state_ids.setdefault(state, len(state_ids))
+        symbol_ids.setdefault(symbol, len(symbol_ids))
+        if next_state is not None:
+            state_ids.setdefault(next_state, len(state_ids))
+
+    table = np.full((len(state_ids), len(symbol_ids)), -1, dtype=np.int32)
+    for (state, symbol), next_state in dfa.transitions.items():
+        if next_state is not None:
+            table[state_ids[state], symbol_ids[symbol]] = state_ids[next_state]
+
+    accept_mask = np.zeros(len(state_ids), dtype=np.bool_)
+    for state in dfa.accept_states:
+        if state in state_ids:
+            accept_mask[state_ids[state]] = True
+
+    return state_ids, list(state_ids), symbol_ids, table, accept_mask
+
+
+@njit(cache=True)
+def _run_dfa(table, start, accept_mask, s_ids):
+    """Runs a compiled DFA (see _compile_dfa_table) over a string.
+
+    Args:
+        table: The transition table of the DFA.
+        start: The id of the start state.
+        accept_mask: The boolean array marking the accepting states.
+        s_ids: The input string as an array of symbol ids, -1 for symbols
+            outside the alphabet.
+
+    Returns:
+        A tuple containing:
+        - An array with the ids of the states in the path.
+        - A boolean indicating whether the string is accepted.
+    """
+
+    cur = start
+    path = np.empty(len(s_ids) + 1, np.int32)
+    path[0] = cur
+    i = 1
+    for c in s_ids:
+        if c < 0:
+            return path[:i], False
+        nxt = table[cur, c]
+        if nxt < 0:
+            return path[:i], False
+        cur = nxt
+        path[i] = cur
+        i += 1
+    return path[:i], bool(accept_mask[cur])
+
+
+def _reachable_states(dfa):
+    """Returns the set of states of a DFA reachable from its start state."""
+
+    successors = defaultdict(list)
+    for (state, _), next_state in dfa.transitions.items():
+        if next_state is not None:
+            successors[state].append(next_state)
+
+    reachable = {dfa.start_state}
+    frontier = [dfa.start_state]
+    while frontier:
+        state = frontier.pop()
+        for next_state in successors[state]:
+            if next_state not in reachable:
+                reachable.add(next_state)
+                frontier.append(next_state)
+
+    return reachable
+
+
+def visualize_dfa(dfa, prune=False):
     """Visualizes a DFA using Graphviz.
 
     Args:
-        dfa: A dictionary representing the DFA, with the following structure:
+        dfa: A DFA, or a dictionary representing the DFA with the following
+            structure:
             - 'states': A list of states.
             - 'alphabet': A list of input symbols.
             - 'transitions': A dictionary of transitions, where keys are tuples
               of (state, input symbol), and values are the next states.
             - 'start_state': The start state.
             - 'accept_states': A list of accepting states.
+        prune: Whether to leave out the states that cannot be reached from the
+            start state, along with their transitions (e.g. dead subsets left
+            over from a subset construction).
 
     Returns:
-        A Graphviz object representing the DFA.
+        The DOT source of the DFA diagram (see render_dot).
     """
 
-    graph = gv.Digraph(format='png')  # Choose a suitable output format
+    return _dfa_dot(dfa, prune)
 
-    # Add nodes for states, highlighting accepting states
-    for state in dfa['states']:
-        shape = 'doublecircle' if state in dfa['accept_states'] else 'circle'
-        state_name = str(state)
-        graph.node(state_name, shape=shape)
 
-    # Add edges for transitions
-    for (state, symbol), next_state in dfa['transitions'].items():
-        # Special handling for empty string
-        label = f"{symbol}" if symbol != 'λ' else 'ε'
-        current_state_name = str(state)
-        next_state_name = str(next_state)
-        graph.edge(current_state_name, next_state_name, label=label)
+@_memoize_dfa
+def _dfa_dot(dfa, prune):
+    """Builds the DOT source of a DFA diagram (see visualize_dfa)."""
+
+    dfa = _as_dfa(dfa)
+    accept = dfa.accept_states
+    states = dfa.states
+    transitions = dfa.transitions.items()
+    if prune:
+        reachable = _reachable_states(dfa)
+        states = [state for state in states if state in reachable]
+        transitions = [((state, symbol), next_state)
+                       for (state, symbol), next_state in transitions
+                       if state in reachable]
+
+    lines = []
+
+    # Add nodes for states, highlighting accepting states
+    for state in states:
+        shape = 'doublecircle' if state in accept else 'circle'
+        lines.append(f'\t{_quote(state)} [shape={shape}]')
+
+    # Add edges for transitions, one per pair of states
+    edges = _group_edges((state, symbol, next_state)
+                         for (state, symbol), next_state in transitions)
+    for (state, next_state), symbols in edges.items():
+        label = _edge_label(symbols)
+        lines.append(
+            f'\t{_quote(state)} -> {_quote(next_state)} [label={_quote(label)}]')
 
     # Highlight the start state
-    graph.node(str(dfa['start_state']), shape='circle',
-               style='filled', fillcolor='lightblue')
+    lines.append(f'\t{_quote(dfa.start_state)} '
+                 '[fillcolor=lightblue shape=circle style=filled]')
+
+    return _dot(lines)
+
+
+def _dfa_path(dfa, s):
+    """Runs a DFA over a string, recording the states it passes through.
 
-    return graph
+    A DFA is compiled into a transition table once, so when Numba is
+    installed its paths are run by the Numba-compiled _run_dfa. Dictionary
+    views, and any DFA when Numba is missing, use direct transition lookups.
+
+    Args:
+        dfa: A DFA or a _DFAView.
+        s: The input string.
+
+    Returns:
+        A tuple containing:
+        - A list of states in the path, up to where the DFA got stuck.
+        - A boolean indicating whether the string is accepted.
+    """
+
+    if _HAS_NUMBA and isinstance(dfa, DFA):
+        (state_ids, states, symbol_ids, table,
+         accept_mask) = _compile_dfa_table(dfa)
+        s_ids = np.fromiter((symbol_ids.get(symbol, -1) for symbol in s),
+                            dtype=np.int32, count=len(s))
+        path_ids, accepted = _run_dfa(table, state_ids[dfa.start_state],
+                                      accept_mask, s_ids)
+
+        return [states[i] for i in path_ids.tolist()], accepted
+
+    # A plain dictionary lookup per symbol; this needs no compilation, so it
+    # is never slower than the original loop
+    transitions = dfa.transitions
+
+    # The path holds the start state plus at most one state per symbol
+    path = [None] * (len(s) + 1)
+    current_state = path[0] = dfa.start_state
+    i = 1
+    for symbol in s:
+        next_state = transitions.get((current_state, symbol))
+        if next_state is None:
+            del path[i:]
+            return path, False
+        current_state = path[i] = next_state
+        i += 1
+
+    return path, current_state in dfa.accept_states
 
 
 def visualize_dfa_path(dfa, s):
     """Visualizes a DFA path for a given string using Graphviz.
 
     Args:
-        dfa: A dictionary representing the DFA, with the following structure:
+        dfa: A DFA, or a dictionary representing the DFA with the following
+            structure:
             - 'states': A list of states.
             - 'alphabet': A list of input symbols.
             - 'transitions': A dictionary of transitions, where keys are tuples
@@ -55,54 +372,59 @@ def visualize_dfa_path(dfa, s):
 
     Returns:
         A tuple containing:
-        - A Graphviz object representing the DFA path.
+        - The DOT source of the DFA path diagram (see render_dot).
         - A boolean indicating whether the string is accepted.
         - A list of states in the path.
     """
 
-    accepted = True
+    dfa = _as_dfa(dfa)
+    accept = dfa.accept_states
 
     # Create a DFA path for the string
-    current_state = dfa['start_state']
-    path = [current_state]
-    for symbol in s:
-        next_state = dfa['transitions'].get((current_state, symbol), None)
-        if next_state is None:
-            accepted = False
-            break
-        current_state = next_state
-        path.append(current_state)
+    path, accepted = _dfa_path(dfa, s)
 
-    accepted = accepted and current_state in dfa['accept_states']
     accepted_color = 'green' if accepted else 'red'
 
+    # (state, symbol) pairs taken along the path, for O(1) edge highlighting;
+    # symbols after the point where the DFA got stuck were never consumed
+    path_edges = set(zip(path, s[:len(path) - 1]))
+
     # Create a DFA path graph
-    graph = gv.Digraph(format='png')
+    lines = []
 
     # Add the string 's' at the top of the image
-    graph.node('s', label=s, shape='none', fontsize='20', fontweight='bold')
-
-    # Highlight the start state
-    graph.node(dfa['start_state'], shape='circle',
-               style='filled', fillcolor='lightblue')
-
-    # Add nodes for states, highlighting accepting states
-    for state in dfa['states']:
-        shape = 'doublecircle' if state in dfa['accept_states'] else 'circle'
+    lines.append(
+        f'\ts [label={_quote(s)} fontsize=20 fontweight=bold shape=none]')
+
+    # Add nodes for states, each declared once with its final attributes:
+    # accepting states are double circles, the last state in the path is
+    # filled with the result colour and the start state is highlighted
+    nodes = dfa.states
+    if dfa.start_state not in nodes:
+        nodes = [dfa.start_state, *nodes]
+    for state in nodes:
+        shape = 'doublecircle' if state in accept else 'circle'
         if state == path[-1]:  # last state in the path
-            graph.node(state, shape=shape, style='filled',
-                       fillcolor=accepted_color)
+            lines.append(f'\t{_quote(state)} [fillcolor={accepted_color} '
+                         f'shape={shape} style=filled]')
+        elif state == dfa.start_state:
+            lines.append(f'\t{_quote(state)} [fillcolor=lightblue '
+                         f'shape={shape} style=filled]')
         else:
-            graph.node(state, shape=shape)
+            lines.append(f'\t{_quote(state)} [shape={shape}]')
 
-    # Add edges for transitions
-    for (state, symbol), next_state in dfa['transitions'].items():
-        # Special handling for empty string
-        label = f"{symbol}" if symbol != 'λ' else 'ε'
-        graph.edge(state, next_state, label=label, color=accepted_color if (
-            state, symbol) in zip(path, s) else 'black')  # Highlight the path
+    # Add edges for transitions, one per pair of states
+    edges = _group_edges((state, symbol, next_state)
+                         for (state, symbol), next_state in dfa.transitions.items())
+    for (state, next_state), symbols in edges.items():
+        label = _edge_label(symbols)
+        on_path = path_edges and any((state, symbol) in path_edges
+                                     for symbol in symbols)
+        color = accepted_color if on_path else 'black'
+        lines.append(f'\t{_quote(state)} -> {_quote(next_state)} '
+                     f'[label={_quote(label)} color={color}]')  # Highlight the path
 
-    return graph, accepted, path
+    return _dot(lines), accepted, path
 
 
 def visualize_nfa(nfa):
@@ -118,46 +440,111 @@ def visualize_nfa(nfa):
             - 'accept_states': A list of accepting states.
 
     Returns:
-        A Graphviz object representing the NFA.
+        The DOT source of the NFA diagram (see render_dot).
     """
 
-    graph = gv.Digraph(format='png')  # Choose a suitable output format
+    return _dot(_emit_nfa(nfa))
+
+
+def _emit_nfa(nfa, *, show_closures=False):
+    """Builds the DOT statements of an NFA or e-NFA diagram.
+
+    Args:
+        nfa: A dictionary representing the NFA (see visualize_nfa).
+        show_closures: Whether to label each state with its epsilon closure,
+            taken from nfa['epsilon_closures'] (see visualize_e_nfa).
+
+    Returns:
+        A list of DOT statements.
+    """
+
+    accept = frozenset(nfa['accept_states'])
+
+    lines = []
 
     # Add nodes for states, highlighting accepting states
     for state in nfa['states']:
-        shape = 'doublecircle' if state in nfa['accept_states'] else 'circle'
-        graph.node(state, shape=shape)
+        shape = 'doublecircle' if state in accept else 'circle'
+        lines.append(f'\t{_quote(state)} [shape={shape}]')
 
     # Add edges for transitions, handling multiple next states
-    for (state, symbol), next_states in nfa['transitions'].items():
-        # Special handling for empty string
-        label = f"{symbol}" if symbol != 'λ' else 'ε'
-        for next_state in next_states:
-            # Create edges for all next states
-            graph.edge(state, next_state, label=label)
+    edges = _group_edges((state, symbol, next_state)
+                         for (state, symbol), next_states in nfa['transitions'].items()
+                         for next_state in next_states)
+    for (state, next_state), symbols in edges.items():
+        label = _edge_label(symbols)
+        lines.append(f'\t{_quote(state)} -> {_quote(next_state)} '
+                     f'[label={_quote(label)}]')
 
     # Highlight the start state
-    graph.node(nfa['start_state'], shape='circle',
-               style='filled', fillcolor='lightblue')
+    lines.append(f'\t{_quote(nfa["start_state"])} '
+                 '[fillcolor=lightblue shape=circle style=filled]')
+
+    if show_closures:
+        # Label states whose closure reaches other states with that closure
+        for state, closure in nfa.get('epsilon_closures', {}).items():
+            if len(closure) > 1:
+                members = ', '.join(str(member)
+                                    for member in sorted(closure, key=str))
+                lines.append(f'\t{_quote(state)} '
+                             f'[xlabel={_quote(f"ε-closure: {{{members}}}")}]')
 
-    return graph
+    return lines
 
 
 def calculate_epsilon_closures(nfa):
+    """Calculates the epsilon closure of every state of an NFA.
+
+    Epsilon graphs are sparse, so a depth-first search from each state is
+    cheaper than a dense transitive closure. All searches share one visited
+    map, which is cleared after each search for just the states it reached.
+
+    Args:
+        nfa: A dictionary representing the NFA, with the following structure:
+            - 'states': A list of states.
+            - 'transitions': A dictionary of transitions, where keys are tuples
+              of (state, input symbol), and values are lists of next states.
+              Epsilon transitions use the symbol 'λ'.
+
+    Returns:
+        A dictionary mapping each state to its epsilon closure (the set of
+        states reachable through epsilon transitions, including itself).
+    """
+
+    transitions = nfa['transitions']
+
+    state_ids = {}
+    for state in nfa['states']:
+        state_ids.setdefault(state, len(state_ids))
+    for (state, symbol), next_states in transitions.items():
+        if symbol == 'λ':
+            state_ids.setdefault(state, len(state_ids))
+            for next_state in next_states:
+                state_ids.setdefault(next_state, len(state_ids))
+
+    # Epsilon successors by state id, so the searches below neither build
+    # (state, 'λ') keys nor hash state names
+    states = list(state_ids)
+    eps_adj = [[state_ids[next_state]
+                for next_state in transitions.get((state, 'λ'), [])]
+               for state in states]
+    visited = bytearray(len(states))
 
     epsilon_closures = {}
     for state in nfa['states']:
-        epsilon_closures[state] = set()
-        visited = set()
-        stack = [state]
+        closure = []
+        stack = [state_ids[state]]
         while stack:
-            current_state = stack.pop()
-            if current_state in visited:
+            current_id = stack.pop()
+            if visited[current_id]:
                 continue
-            visited.add(current_state)
-            epsilon_closures[state].add(current_state)
-            for next_state in nfa['transitions'].get((current_state, 'λ'), []):
-                stack.append(next_state)
+            visited[current_id] = 1
+            closure.append(current_id)
+            stack.extend(eps_adj[current_id])
+
+        for member_id in closure:
+            visited[member_id] = 0
+        epsilon_closures[state] = {states[member_id] for member_id in closure}
 
     return epsilon_closures
 
@@ -177,29 +564,12 @@ def visualize_e_nfa(nfa):
               (a set of states reachable through epsilon transitions).
 
     Returns:
-        A Graphviz object representing the NFA.
+        The DOT source of the NFA diagram (see render_dot), where each state
+        whose epsilon closure contains other states is labelled with that
+        closure.
     """
 
-    graph = gv.Digraph(format='png')  # Choose a suitable output format
-
-    # Add nodes for states, highlighting accepting states
-    for state in nfa['states']:
-        shape = 'doublecircle' if state in nfa['accept_states'] else 'circle'
-        graph.node(state, shape=shape)
-
-    # Add edges for transitions, handling multiple next states
-    for (state, symbol), next_states in nfa['transitions'].items():
-        # Special handling for empty string
-        label = f"{symbol}" if symbol != 'λ' else 'ε'
-        for next_state in next_states:
-            # Create edges for all next states
-            graph.edge(state, next_state, label=label)
-
-    # Highlight the start state
-    graph.node(nfa['start_state'], shape='circle',
-               style='filled', fillcolor='lightblue')
-
-    return graph
+    return _dot(_emit_nfa(nfa, show_closures=True))
 
 
 def convert_nfa_to_dfa(nfa):
@@ -290,22 +660,22 @@ def visualize_rg(rg):
             - 'start_variable': The start variable.
 
     Returns:
-        A Graphviz object representing the Regular Grammar.
+        The DOT source of the Regular Grammar diagram (see render_dot).
     """
 
-    graph = gv.Digraph(format='png')  # Choose a suitable output format
+    lines = []
 
     # Add nodes for variables
     for variable in rg['variables']:
         shape = 'doublecircle' if variable == rg['start_variable'] else 'circle'
-        graph.node(variable, shape=shape)
+        lines.append(f'\t{_quote(variable)} [shape={shape}]')
 
     # Add edges for productions
     for variable, productions in rg['productions'].items():
         for production in productions:
-            graph.edge(variable, production)
+            lines.append(f'\t{_quote(variable)} -> {_quote(production)}')
 
-    return graph
+    return _dot(lines)
 
 
 def convert_rg_to_dfa(rg):
@@ -417,32 +787,39 @@ def visualize_pda(pda):
             - 'accept_states': A list of accepting states.
 
     Returns:
-        A Graphviz object representing the PDA.
+        The DOT source of the PDA diagram (see render_dot).
     """
 
-    # Increase the size of the graph
-    graph = gv.Digraph(format='png')
+    accept = frozenset(pda['accept_states'])
+
+    lines = []
 
     # Add nodes for states, highlighting accepting states
     for state in pda['states']:
-        shape = 'doublecircle' if state in pda['accept_states'] else 'circle'
-        graph.node(state, shape=shape)
+        shape = 'doublecircle' if state in accept else 'circle'
+        lines.append(f'\t{_quote(state)} [shape={shape}]')
 
     # Add edges for transitions, handling multiple next states
     for (state, symbol, stack_top), next_states in pda['transitions'].items():
         for next_state, push_symbol in next_states:
             label = f"{symbol},{stack_top} | {push_symbol}"
-            graph.edge(state, next_state, label=label)
+            lines.append(f'\t{_quote(state)} -> {_quote(next_state)} '
+                         f'[label={_quote(label)}]')
 
     # Highlight the start state
-    graph.node(pda['start_state'], shape='circle',
-               style='filled', fillcolor='lightblue')
+    lines.append(f'\t{_quote(pda["start_state"])} '
+                 '[fillcolor=lightblue shape=circle style=filled]')
 
-    return graph
+    return _dot(lines)
 
 
 if __name__ == '__main__':
 
+    from concurrent.futures import ProcessPoolExecutor
+
+    # (title, DOT source, output path) of every diagram to render
+    jobs = []
+
     def test_dfa():
 
         dfa = {
@@ -462,23 +839,19 @@ if __name__ == '__main__':
 
         # 1) Visualize the DFA
         graph = visualize_dfa(dfa)
-        # Render and save the diagram
-        graph.render('images/dfa/dfa_visualization', cleanup=True)
-        print("\n✅ DFA visualization saved to images/dfa/dfa_visualization.png")
+        jobs.append(('DFA visualization', graph, 'images/dfa/dfa_visualization.png'))
 
         # 2) Visualize the DFA path for a given string (rejected case)
         s = "1000101"
         graph, accepted, path = visualize_dfa_path(dfa, s)
         print(f"String: {s}, Accepted: {accepted}, Path: {path}")
-        graph.render('images/dfa/dfa_path_visualization1', cleanup=True)
-        print("\n✅ DFA path visualization saved to images/dfa/dfa_path_visualization1.png")
+        jobs.append(('DFA path visualization', graph, 'images/dfa/dfa_path_visualization1.png'))
 
         # 3) Visualize the DFA path for a given string (accepted case)
         s = "0010111"
         graph, accepted, path = visualize_dfa_path(dfa, s)
         print(f"String: {s}, Accepted: {accepted}, Path: {path}")
-        graph.render('images/dfa/dfa_path_visualization2', cleanup=True)
-        print("\n✅ DFA path visualization saved to images/dfa/dfa_path_visualization2.png")
+        jobs.append(('DFA path visualization', graph, 'images/dfa/dfa_path_visualization2.png'))
 
     def test_nfa():
 
@@ -498,15 +871,12 @@ if __name__ == '__main__':
 
         # 1) Visualize the NFA
         graph = visualize_nfa(nfa)
-        # Render and save the diagram
-        graph.render('images/nfa/nfa_visualization', cleanup=True)
-        print("\n✅ NFA visualization saved to images/nfa/nfa_visualization.png")
+        jobs.append(('NFA visualization', graph, 'images/nfa/nfa_visualization.png'))
 
         # 2) Convert the NFA to a DFA and visualize the result
         dfa = convert_nfa_to_dfa(nfa)
         graph = visualize_dfa(dfa)
-        # Render and save the diagram
-        graph.render('images/nfa/conversion_to_dfa', cleanup=True)
+        jobs.append(('NFA to DFA visualization', graph, 'images/nfa/conversion_to_dfa.png'))
 
     def test_e_nfa():
 
@@ -529,8 +899,7 @@ if __name__ == '__main__':
 
         # 1) Visualize the Epsilon NFA
         graph = visualize_e_nfa(e_nfa)
-        graph.render('images/e_nfa/epsilon_e_nfa_visualization', cleanup=True)
-        print("\n✅ Epsilon NFA visualization saved to images/e_nfa/epsilon_e_nfa_visualization.png")
+        jobs.append(('Epsilon NFA visualization', graph, 'images/e_nfa/epsilon_e_nfa_visualization.png'))
 
     def test_rg():
 
@@ -546,17 +915,12 @@ if __name__ == '__main__':
 
         # 1) Visualize the Regular Grammar
         graph = visualize_rg(rg)
-        # Render and save the diagram
-        graph.render('images/rg/rg_visualization', cleanup=True)
-        print("\n✅ Regular Grammar visualization saved to images/rg/rg_visualization.png")
+        jobs.append(('Regular Grammar visualization', graph, 'images/rg/rg_visualization.png'))
 
         # 2) Convert the Regular Grammar to a DFA and visualize the result
         dfa = convert_rg_to_dfa(rg)
         graph = visualize_dfa(dfa)
-        # Render and save the diagram
-        graph.render('images/rg/conversion_to_dfa', cleanup=True)
-        print(
-            "\n✅ Conversion to DFA visualization saved to images/rg/conversion_to_dfa.png")
+        jobs.append(('Conversion to DFA visualization', graph, 'images/rg/conversion_to_dfa.png'))
 
         # DFA to RG (Language contains substring 'aba')
         dfa = {
@@ -578,16 +942,12 @@ if __name__ == '__main__':
 
         # 1) Visualize the DFA
         graph = visualize_dfa(dfa)
-        # Render and save the diagram
-        graph.render('images/rg/dfa_visualization', cleanup=True)
-        print("\n✅ DFA visualization saved to images/rg/dfa_visualization.png")
+        jobs.append(('DFA visualization', graph, 'images/rg/dfa_visualization.png'))
 
         # 2) Convert the DFA to a Regular Grammar and visualize the result
         rg = convert_dfa_to_rg(dfa)
         graph = visualize_rg(rg)
-        # Render and save the diagram
-        graph.render('images/rg/conversion_to_rg', cleanup=True)
-        print("\n✅ Conversion to Regular Grammar visualization saved to images/rg/conversion_to_rg.png")
+        jobs.append(('Conversion to Regular Grammar visualization', graph, 'images/rg/conversion_to_rg.png'))
 
     def test_pda():
 
@@ -610,12 +970,17 @@ if __name__ == '__main__':
 
         # 1) Visualize the PDA
         graph = visualize_pda(pda)
-        # Render and save the diagram
-        graph.render('images/pda/pda_visualization', cleanup=True)
-        print("\n✅ PDA visualization saved to images/pda/pda_visualization.png")
+        jobs.append(('PDA visualization', graph, 'images/pda/pda_visualization.png'))
 
     test_dfa()
     test_nfa()
     test_e_nfa()
     test_rg()
     test_pda()
+
+    # Render the diagrams concurrently, each worker runs its own 'dot' process
+    with ProcessPoolExecutor(max_workers=4) as executor:
+        renders = executor.map(
+            _render_job, [(graph, out_path) for _, graph, out_path in jobs])
+        for (title, _, out_path), _ in zip(jobs, renders):
+            print(f"\n✅ {title} saved to {out_path}")